@@ -1,7 +1,11 @@
 """Application entry point via the `run` method of the Gamatrix class."""
 
+import os
+import pathlib
 import pickle
-from typing import Dict, List, Optional
+import sys
+import threading
+from typing import BinaryIO, Dict, List, Optional
 
 import steam.client  # type: ignore
 import steam.enums  # type: ignore
@@ -20,40 +24,91 @@ class Gamatrix(interfaces.IClientProvider):
     def __init__(self, conf: interfaces.IConfiguration):
         self.config = conf
         self._steam_client = None
+        self._steam_webapi = None
+        self._lock = threading.Lock()  # get_games may be called from several threads
         self._friends_list: Optional[List[types.FriendInformation]] = None
+        self._friends_by_name: Optional[Dict[str, types.FriendInformation]] = None
         self._games_list: Dict[str, List[types.GameInformation]] = {}
 
-        self.friend_cache_file = conf.cache_path().joinpath(self.FriendsCacheFileName)
-        try:
-            with open(self.friend_cache_file, "rb") as cached_friends:
-                cf = cached_friends.read()
-                self._friends_list = self._load_friends_cache(cf)
-        except FileNotFoundError:
-            print("No cache file found for friends, will retrieve from game client.")
+        # cache files are only read the first time their data is asked for, and only
+        # written back out when something new was fetched from the game client
+        self._friends_cache_read = False
+        self._games_cache_read = False
+        self._friends_cache_dirty = False
+        self._games_cache_dirty = False
 
+        self.friend_cache_file = conf.cache_path().joinpath(self.FriendsCacheFileName)
         self.games_cache_file = conf.cache_path().joinpath(self.GamesCacheFileName)
-        try:
-            with open(self.games_cache_file, "rb") as cached_games:
-                cg = cached_games.read()
-                self._games_list = self._load_games_cache(cg) or {}
-        except FileNotFoundError:
-            print("No cache file found for game data, will retrieve from game client.")
+
+    def _read_friends_cache(self):
+        """Load the friends cache file, if it has not already been loaded."""
+        with self._lock:
+            if self._friends_cache_read:
+                return
+            self._friends_cache_read = True
+
+            try:
+                with open(self.friend_cache_file, "rb") as cached_friends:
+                    self._friends_list = self._load_friends_cache(cached_friends)
+            except FileNotFoundError:
+                print(
+                    "No cache file found for friends, will retrieve from game client."
+                )
+            except (
+                AttributeError,
+                EOFError,
+                ImportError,
+                ValueError,
+                pickle.UnpicklingError,
+            ):
+                print("Unreadable friends cache file, will retrieve from game client.")
+
+    def _read_games_cache(self):
+        """Load the games cache file, if it has not already been loaded."""
+        with self._lock:
+            if self._games_cache_read:
+                return
+            self._games_cache_read = True
+
+            try:
+                with open(self.games_cache_file, "rb") as cached_games:
+                    self._games_list = self._load_games_cache(cached_games) or {}
+            except FileNotFoundError:
+                print(
+                    "No cache file found for game data, will retrieve from game client."
+                )
+            except (
+                AttributeError,
+                EOFError,
+                ImportError,
+                ValueError,
+                pickle.UnpicklingError,
+            ):
+                print(
+                    "Unreadable game data cache file, will retrieve from game client."
+                )
 
     def _load_friends_cache(
-        self, friends_data: bytes
+        self, friends_file: BinaryIO
     ) -> Optional[List[types.FriendInformation]]:
-        return pickle.loads(friends_data)
+        # unpickle straight from the file rather than reading it all into memory
+        return pickle.load(friends_file)
 
     def _load_games_cache(
-        self, games_data: bytes
+        self, games_file: BinaryIO
     ) -> Optional[Dict[str, List[types.GameInformation]]]:
-        return pickle.loads(games_data)
+        return pickle.load(games_file)
 
     def _store_friends_cache(self) -> Optional[bytes]:
-        return pickle.dumps(self._friends_list)
+        if not self._friends_cache_dirty:
+            return None  # nothing new, leave the cache file as it is
+        # protocol 4 is the newest that Python 3.7 can read back
+        return pickle.dumps(self._friends_list, protocol=4)
 
     def _store_games_cache(self) -> Optional[bytes]:
-        return pickle.dumps(self._games_list)
+        if not self._games_cache_dirty:
+            return None  # nothing new, leave the cache file as it is
+        return pickle.dumps(self._games_list, protocol=4)
 
     def client(self) -> steam.client.SteamClient:
         """The logged in Steam client to use in querying for information."""
@@ -64,8 +119,18 @@ def client(self) -> steam.client.SteamClient:
 
         return self._steam_client
 
+    def webapi(self) -> steam.webapi.WebAPI:
+        """The Steam web API instance, created once and reused for every call."""
+        with self._lock:
+            if self._steam_webapi is None:
+                # creating a WebAPI fetches the list of supported interfaces from Steam
+                self._steam_webapi = steam.webapi.WebAPI(key=self.config.api_key())
+
+        return self._steam_webapi
+
     def get_cached_friends(self) -> Optional[List[types.FriendInformation]]:
         """Return a list of all known friends from prior calls to the client API."""
+        self._read_friends_cache()
         return self._friends_list
 
     def get_friends(self, force: bool = False) -> List[types.FriendInformation]:
@@ -77,23 +142,25 @@ def get_friends(self, force: bool = False) -> List[types.FriendInformation]:
         if friends_list is None:
             all_friends = self.client().friends
 
-            # Add all my friends
+            # Put myself at the top of the list... (I am queried for info too!)
             friends_list = [
                 types.FriendInformation(
-                    name=friend.name, user_id=f"{friend.steam_id.as_64}"
+                    name=self.client().username,
+                    user_id=f"{self.client().steam_id.as_64}",
                 )
-                for friend in all_friends
             ]
 
-            # Inject myself at the top of the list... (I am queried for info too!)
-            friends_list.insert(
-                0,
+            # Add all my friends
+            friends_list.extend(
                 types.FriendInformation(
-                    name=self.client().username,
-                    user_id=f"{self.client().steam_id.as_64}",
-                ),
+                    name=friend.name, user_id=f"{friend.steam_id.as_64}"
+                )
+                for friend in all_friends
             )
             self._friends_list = friends_list
+            self._friends_by_name = None
+            self._friends_cache_read = True
+            self._friends_cache_dirty = True
 
         return friends_list
 
@@ -101,10 +168,14 @@ def get_friend_by_name(
         self, name: str, force: bool = False
     ) -> Optional[types.FriendInformation]:
         friends = self.get_friends(force=force)
-        for friend in friends:
-            if friend.name == name:
-                return friend
-        return None
+
+        # build the name lookup once per friends list, rather than scanning each call
+        if self._friends_by_name is None:
+            self._friends_by_name = {}
+            for friend in friends:
+                self._friends_by_name.setdefault(friend.name, friend)
+
+        return self._friends_by_name.get(name)
 
     def get_user_id(self, friend_name: str = "", force: bool = False) -> str:
         """Return the user id for the friend-name given, or for the logged-in user."""
@@ -121,27 +192,31 @@ def get_user_id(self, friend_name: str = "", force: bool = False) -> str:
 
     def get_cached_games(self, user_id: str) -> Optional[List[types.GameInformation]]:
         """Return the list of game information already stored for this user."""
-        if user_id in self._games_list:
-            return self._games_list[user_id]
-        return None
+        self._read_games_cache()
+        return self._games_list.get(user_id)
 
     def get_games(
         self, user_id: str, force: bool = False
     ) -> List[types.GameInformation]:
         """Use a steam client instance to get a list of owned games for a user."""
 
+        # an unknown friend resolves to no user id, don't ask Steam about nobody
+        if not user_id:
+            return []
+
         games_list = None
 
+        # new results are merged into the cached ones, so make sure they're loaded
+        self._read_games_cache()
+
         if not force:
             games_list = self.get_cached_games(user_id=user_id)
 
         if games_list is None:
 
-            api_key = self.config.api_key()
-            api = steam.webapi.WebAPI(key=api_key)
-            response = api.call(
+            response = self.webapi().call(
                 "IPlayerService.GetOwnedGames",
-                key=api_key,
+                key=self.config.api_key(),
                 steamid=user_id,
                 include_appinfo=True,
                 include_played_free_games=True,
@@ -149,11 +224,14 @@ def get_games(
             )
             r = response["response"]
 
+            # friends tend to own many of the same games, interning the names lets
+            # every list share one string (and the cache pickle store it once)
             self._games_list[user_id] = [
-                types.GameInformation(name=g["name"], appid=g["appid"])
+                types.GameInformation(name=sys.intern(g["name"]), appid=g["appid"])
                 for g in r["games"]
             ]
             games_list = self._games_list[user_id]
+            self._games_cache_dirty = True
 
         return games_list
 
@@ -190,16 +268,17 @@ def _do_exit(self):
         )  # TODO: permissions limit to user
 
         if friends_data is not None:
-            with open(
-                self.config.cache_path().joinpath(self.FriendsCacheFileName), "wb"
-            ) as out_friends_file:
-                out_friends_file.write(friends_data)
+            self._write_cache_file(self.friend_cache_file, friends_data)
 
         if games_data is not None:
-            with open(
-                self.config.cache_path().joinpath(self.GamesCacheFileName), "wb"
-            ) as out_games_file:
-                out_games_file.write(games_data)
+            self._write_cache_file(self.games_cache_file, games_data)
+
+    def _write_cache_file(self, cache_file: pathlib.Path, data: bytes):
+        """Replace a cache file in one step, so it is never left half written."""
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        with open(tmp_file, "wb") as out_file:
+            out_file.write(data)
+        os.replace(tmp_file, cache_file)
 
     def run(self):
         if self.config.command() and self.config.command() != "":
@@ -212,7 +291,9 @@ def run(self):
                 )
             try:
                 results = cmd.run(self.config, self)
-                print(*results, sep="\n")
+                # one write for the whole output, large game lists run to thousands
+                # of lines
+                sys.stdout.write("\n".join(results) + "\n")
 
             except types.GamatrixExit:
                 pass
@@ -1,4 +1,5 @@
 from ._abc import Command  # noqa F401
+from ._compare import Compare  # noqa F401
 from ._exit import Exit  # noqa F401
 from ._friends import Friends  # noqa F401
 from ._games import Games  # noqa F401
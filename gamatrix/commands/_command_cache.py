@@ -12,14 +12,7 @@
 def get_command(command: str) -> Optional[Command]:
     """Ensure the command issued is one we support else return 'Unknown' command."""
 
-    cmd_map = _mapping()
-    cmd = None
-    command_name = command.lower()
-
-    if command_name in cmd_map:
-        cmd = cmd_map[command_name]
-
-    return cmd
+    return _mapping().get(command.lower())
 
 
 @functools.lru_cache()
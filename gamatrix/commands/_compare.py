@@ -1,8 +1,9 @@
 """Module containing compare command implementation."""
 
+import concurrent.futures
 import dataclasses
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set
 
 from . import _abc
 
@@ -11,6 +12,9 @@
 
 COMPARE_CMD_VERSION = "0.1"
 
+# upper bound on how many friends' game libraries are requested at once
+MAX_LIBRARY_FETCHES = 8
+
 
 @dataclasses.dataclass
 class CompareCmdOptions:
@@ -19,7 +23,7 @@ class CompareCmdOptions:
 
 @dataclasses.dataclass
 class FriendGameComparison:
-    owned_by: List[types.FriendInformation]
+    owned_by: Set[str]  # user ids of the friends who own the game
     game: types.GameInformation
 
 
@@ -53,78 +57,81 @@ def run_impl(
         """Compare the logged-in user's games to the friends specified."""
 
         # get a list of unique, valid, friends
-        friends = list(
-            filter(
-                lambda f: f.name in options["--friend"],
-                client.get_friends(force=config.force),
-            )
-        )
+        requested_names = set(options["--friend"])
+        friends = [
+            f
+            for f in client.get_friends(force=config.force)
+            if f.name in requested_names
+        ]
         game_list: Dict[str, FriendGameComparison] = {}
 
-        # build up a list of games, and add friends who own each.
-        for friend in friends:
+        def get_library(friend: types.FriendInformation) -> List[types.GameInformation]:
+            return client.get_games(user_id=friend.user_id, force=config.force)
 
-            friend_games = client.get_games(user_id=friend.user_id, force=config.force)
+        # each friend's library is a separate request, so fetch them concurrently
+        libraries: List[List[types.GameInformation]] = []
+        if friends:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(friends), MAX_LIBRARY_FETCHES)
+            ) as executor:
+                libraries = list(executor.map(get_library, friends))
+
+        # build up a list of games, and add friends who own each.
+        for friend, friend_games in zip(friends, libraries):
 
             for game in friend_games:
-                if game.appid in game_list:
-                    game_list[game.appid].owned_by.append(friend)
+                comparison = game_list.get(game.appid)
+                if comparison is not None:
+                    comparison.owned_by.add(friend.user_id)
                 else:
                     game_list[game.appid] = FriendGameComparison(
-                        owned_by=[friend], game=game
+                        owned_by={friend.user_id}, game=game
                     )
 
         # create output lists, by number of friends who own each game
         # output the list of games owned by everyone first.
 
         # create the title row and pre-populate each list of games by number of owners...
-        title_row = ["Game"]
-        games_by_num_owners: List[List[Any]] = []
-        for friend in friends:
-            games_by_num_owners.append([])
-            title_row.append(f'"{friend.name}"')
+        title_row = ["Game"] + [f'"{friend.name}"' for friend in friends]
+        games_by_num_owners: List[List[Any]] = [[] for _ in friends]
 
         skip_partial_owned = options["--all-owned-games"]
 
         # inspect each game and convert to a linear row of data
-        for key in game_list.keys():
+        for current_game in game_list.values():
+            num_owners = len(current_game.owned_by)
 
             # only bother to record partially-owned games if we need to
-            if skip_partial_owned and len(game_list[key].owned_by) != len(friends):
+            if skip_partial_owned and num_owners != len(friends):
                 continue
 
-            current_game = game_list[key]
-            game_row: List[Any] = [
-                f'"{current_game.game.name}"'
-            ]  # add quotes to satisfy CSV nonsense
-
-            # order is important, each entry is either True or False
-            for friend in friends:
-                game_row.append(friend in current_game.owned_by)
+            # add quotes to satisfy CSV nonsense, then one True/False per friend (in
+            # title row order) for whether they own it
+            game_row: List[Any] = [f'"{current_game.game.name}"'] + [
+                friend.user_id in current_game.owned_by for friend in friends
+            ]
 
             # append this to the right number-owned games list
-            games_by_num_owners[len(game_list[key].owned_by) - 1].append(game_row)
+            games_by_num_owners[num_owners - 1].append(game_row)
 
-        gol: List[List[str]] = [
+        # walk the per-owner-count lists once, most owned first, collecting both
+        # the summary lines and the game rows that follow them.
+        summary: List[List[Any]] = []
+        owned_rows: List[List[Any]] = []
+        for index in reversed(range(len(friends))):
+            games_owned = games_by_num_owners[index]
+            if games_owned:
+                msg = f"OWNED BY {index+1} FRIENDS (count={len(games_owned)})"
+                summary.append([msg])
+                owned_rows.extend(games_owned)
+
+        gol: List[List[Any]] = [
             [""],
             [f"compare: Generated on {datetime.datetime.now()}"],
         ]
-        # output a summary
-        for index in reversed(range(len(friends))):
-            if len(games_by_num_owners[index]) > 0:
-                msg = (
-                    f"OWNED BY {index+1} FRIENDS "
-                    f"(count={len(games_by_num_owners[index])})"
-                )
-                gol.append([msg])
-
+        gol.extend(summary)
         gol.append([""])
-        # start building the output.
-        gol.extend([title_row])
-
-        # combine the lists
-        for index in reversed(range(len(friends))):
-            if len(games_by_num_owners[index]) > 0:
-                gol.extend(games_by_num_owners[index])
+        gol.append(title_row)
+        gol.extend(owned_rows)
 
         return [",".join(str(item) for item in row) for row in gol]
@@ -14,6 +14,8 @@ class SupportedOutputTypes(enum.Enum):
     CSV = "csv"
 
 
+SUPPORTED_OUTPUT_FORMATS = frozenset(ot.value for ot in SupportedOutputTypes)
+
 API_KEY_ENV_VAR_NAME = "USER_STEAM_API_DEV_KEY"
 API_KEY_DOTFILE_NAME = ".user_steam_api_dev_key"
 
@@ -36,9 +38,8 @@ def command_args(self) -> List[str]:
         return self.args["<args>"] or []
 
     def output_format(self) -> str:
-        for ot in SupportedOutputTypes:
-            if ot.value == self.args["--output-format"]:
-                return ot.value
+        if self.args["--output-format"] in SUPPORTED_OUTPUT_FORMATS:
+            return self.args["--output-format"]
         return SupportedOutputTypes.TEXT.value
 
     def output_file(self) -> pathlib.Path:
@@ -22,7 +22,10 @@ def get_cached_games(self, user_id: str) -> Optional[List[types.GameInformation]
     def get_games(
         self, user_id: str, force: bool = False
     ) -> List[types.GameInformation]:
-        """Return a list of game information owned by the user specified."""
+        """Return a list of game information owned by the user specified.
+
+        May be called from several threads at once, for different users.
+        """
         raise NotImplementedError
 
     def get_user_id(self, friend_name: str = "", force: bool = False) -> str:
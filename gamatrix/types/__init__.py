@@ -11,6 +11,8 @@ class GamatrixExit(Exception):
 
 @dataclasses.dataclass
 class FriendInformation:
+    __slots__ = ("name", "user_id")
+
     name: str
     user_id: str
 
@@ -30,5 +32,7 @@ class FriendInformation:
 
 @dataclasses.dataclass
 class GameInformation:
+    __slots__ = ("name", "appid")  # a friend's library holds thousands of these
+
     name: str
     appid: str
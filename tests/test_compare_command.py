@@ -0,0 +1,54 @@
+"""Test the compare command."""
+
+import gamatrix.commands as spcmd
+
+from . import utils
+
+
+class TestCompareCommand:
+
+    cfg = utils.Config()
+
+    def _client_provider(self):
+        """Two friends sharing one of the three games between them."""
+        friends_list = utils.get_friends(count=2)
+        games = utils.get_games(3)
+        cli_provider = utils.SettableClientProvider()
+        cli_provider.set_friends = friends_list
+        cli_provider.set_games_by_user_id = {
+            friends_list[0].user_id: games[:2],
+            friends_list[1].user_id: games[1:],
+        }
+        return cli_provider, friends_list, games
+
+    def test_compare_command_exists(self):
+        """Compare command exists and is the right type."""
+        compare_cmd = spcmd.get_command("compare")
+        assert compare_cmd
+        assert isinstance(compare_cmd, spcmd.Compare)
+
+    def test_compare_marks_owners(self):
+        """Each game row flags which of the compared friends own it."""
+        compare_cmd = spcmd.get_command("compare")
+        cli_provider, friends_list, games = self._client_provider()
+        self.cfg.command_args_val = [f"--friend={f.name}" for f in friends_list]
+        output = compare_cmd.run(self.cfg, cli_provider)
+
+        assert f'"{games[0].name}",True,False' in output
+        assert f'"{games[1].name}",True,True' in output
+        assert f'"{games[2].name}",False,True' in output
+        assert "OWNED BY 2 FRIENDS (count=1)" in output
+        assert "OWNED BY 1 FRIENDS (count=2)" in output
+
+    def test_compare_all_owned_games(self):
+        """Only games owned by every friend are listed with --all-owned-games."""
+        compare_cmd = spcmd.get_command("compare")
+        cli_provider, friends_list, games = self._client_provider()
+        self.cfg.command_args_val = [f"--friend={f.name}" for f in friends_list] + [
+            "--all-owned-games"
+        ]
+        output = compare_cmd.run(self.cfg, cli_provider)
+
+        assert f'"{games[1].name}",True,True' in output
+        assert not any(games[0].name in row for row in output)
+        assert not any(games[2].name in row for row in output)
@@ -44,3 +44,16 @@ def test_apikey_env(monkeypatch):
     cfg = config.GamatrixConfig(opts)
     assert cfg.api_key()
     assert cfg.api_key() == TEST_RUN_API_KEY
+
+
+def test_output_format():
+    """Supported output formats are kept, anything else falls back to text."""
+    opts = docopt.docopt(
+        appdoc.__doc__,
+        version="0.0.0+test_run_only",
+        argv=["--output-format=csv", "exit"],
+    )
+    assert config.GamatrixConfig(opts).output_format() == "csv"
+
+    opts["--output-format"] = "xml"
+    assert config.GamatrixConfig(opts).output_format() == "txt"
@@ -1,6 +1,6 @@
 import pathlib
 import random
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from gamatrix import interfaces, types
 
@@ -141,6 +141,7 @@ class SettableClientProvider(interfaces.IClientProvider):
 
     set_friends: List[types.FriendInformation] = []
     set_games: List[types.GameInformation] = []
+    set_games_by_user_id: Dict[str, List[types.GameInformation]] = {}
     set_user_id: str = ""
     get_friends_forced = False
     get_games_forced = False
@@ -161,7 +162,7 @@ def get_games(
         self, user_id: str, force: bool = False
     ) -> List[types.GameInformation]:
         self.get_games_forced = force
-        return self.set_games
+        return self.set_games_by_user_id.get(user_id, self.set_games)
 
     def get_user_id(self, friend_name: str = "", force: bool = False) -> str:
         self.get_user_id_forced = force